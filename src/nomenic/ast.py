@@ -29,6 +29,14 @@ class ASTNode:
     children: list["ASTNode"] = field(default_factory=list)
     value: Optional[Any] = None
 
+    # Visitor method for this node class ("visit_header" for HeaderNode), derived
+    # once per subclass rather than rebuilt from the class name on every accept()
+    _visit_method_name = "visit_ast"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._visit_method_name = f"visit_{cls.__name__.lower().replace('node', '')}"
+
     def accept(self, visitor: Visitor) -> Any:
         """
         Accept a visitor to process this node.
@@ -41,8 +49,7 @@ class ASTNode:
         Returns:
             The result of the visitor's visit method for this node
         """
-        method_name = f"visit_{self.__class__.__name__.lower().replace('node', '')}"
-        method = getattr(visitor, method_name, visitor.visit_block)
+        method = getattr(visitor, self._visit_method_name, visitor.visit_block)
         return method(self)
 
     def normalize(self: T) -> T:
@@ -104,21 +111,19 @@ class DocumentNode(ASTNode):
         """
         super().normalize()
 
-        # Ensure meta block is at the beginning
-        meta_blocks = [
-            c
-            for c in self.children
-            if isinstance(c, BlockNode) and c.block_type == "meta"
-        ]
-        non_meta_blocks = [
-            c
-            for c in self.children
-            if not (isinstance(c, BlockNode) and c.block_type == "meta")
-        ]
+        # Ensure meta block is at the beginning, in a single pass over children
+        meta_block = None
+        non_meta_blocks = []
+        for c in self.children:
+            if isinstance(c, BlockNode) and c.block_type == "meta":
+                # Keep only the first meta block
+                if meta_block is None:
+                    meta_block = c
+            else:
+                non_meta_blocks.append(c)
 
-        if meta_blocks:
-            # Keep only the first meta block
-            self.children = [meta_blocks[0], *non_meta_blocks]
+        if meta_block is not None:
+            self.children = [meta_block, *non_meta_blocks]
         else:
             self.children = non_meta_blocks
 
@@ -7,7 +7,7 @@ import re
 from collections.abc import Generator
 
 from .errors import LexerError
-from .tokens import TOKEN_MAP, Token, TokenType
+from .tokens import BLOCK_TOKEN_MAP, STYLE_TOKEN_MAP, Token, TokenType
 
 
 class Lexer:
@@ -18,6 +18,30 @@ class Lexer:
     can use to build the AST.
     """
 
+    # Regular expression patterns, compiled once at import rather than per
+    # Lexer instance so tokenizing many small documents skips re's cache lookup
+    re_indentation = re.compile(r"^(\s+)")
+    # Stricter block token key: Allow letters, numbers, underscore, hyphen
+    re_block_token_key = r"[a-zA-Z0-9_-]+"  # nosec B105
+    # Make whitespace after colon optional by changing \s+ to \s*
+    re_block_token = re.compile(rf"^({re_block_token_key}):\s*")
+    re_list_item = re.compile(r"^-\s+")
+    # Stricter list marker: Allow numbers or single letters
+    re_ordered_list_item = re.compile(r"^(\d+|[a-zA-Z])\.(\s+)")
+    # Stricter custom directive key - also make whitespace optional
+    re_custom_directive = re.compile(rf"^x-({re_block_token_key}):\s*")
+    # Make whitespace optional for callouts too
+    re_callout = re.compile(r"^(note|warn|tip):\s*")
+    re_inline_annotation_paren = re.compile(r"\([^)]*\)")
+    re_inline_annotation_bracket = re.compile(r"\[[^\]]*\]")
+    re_inline_key_value = re.compile(r"\{[^}]*\}")
+    # All inline style openers in one alternation; group 1 is the style name (a
+    # key of STYLE_TOKEN_MAP). A flat argument (no parens) is matched by
+    # re_inline_style_arg; one containing "(" falls back to balanced matching,
+    # since the grammar allows nested styles and annotations inside a style.
+    re_inline_style = re.compile(r"@(b|bold|i|italic|c|code|l|link)\(")
+    re_inline_style_arg = re.compile(r"[^()]*\)")
+
     def __init__(self, content: str):
         """
         Initialize the lexer with Nomenic content.
@@ -31,27 +55,6 @@ class Lexer:
         self.col_idx = 0  # Current column (0-indexed)
         self.current_line = self.lines[0] if self.lines else ""
 
-        # Regular expression patterns
-        self.re_indentation = re.compile(r"^(\s+)")
-        # Stricter block token key: Allow letters, numbers, underscore, hyphen
-        self.re_block_token_key = r"[a-zA-Z0-9_-]+"  # nosec B105
-        # Make whitespace after colon optional by changing \s+ to \s*
-        self.re_block_token = re.compile(rf"^({self.re_block_token_key}):\s*")
-        self.re_list_item = re.compile(r"^-\s+")
-        # Stricter list marker: Allow numbers or single letters
-        self.re_ordered_list_item = re.compile(r"^(\d+|[a-zA-Z])\.(\s+)")
-        # Stricter custom directive key - also make whitespace optional
-        self.re_custom_directive = re.compile(rf"^x-({self.re_block_token_key}):\s*")
-        # Make whitespace optional for callouts too
-        self.re_callout = re.compile(r"^(note|warn|tip):\s*")
-        self.re_inline_annotation_paren = re.compile(r"\([^)]*\)")
-        self.re_inline_annotation_bracket = re.compile(r"\[[^\]]*\]")
-        self.re_inline_key_value = re.compile(r"\{[^}]*\}")
-        self.re_style_bold = re.compile(r"@b\(([^)]*)\)|@bold\(([^)]*)\)")
-        self.re_style_italic = re.compile(r"@i\(([^)]*)\)|@italic\(([^)]*)\)")
-        self.re_style_code = re.compile(r"@c\(([^)]*)\)|@code\(([^)]*)\)")
-        self.re_style_link = re.compile(r"@l\(([^)]*)\)|@link\(([^)]*)\)")
-
     def tokenize(self) -> list[Token]:
         """
         Tokenize the entire content and return a list of tokens.
@@ -141,13 +144,13 @@ class Lexer:
             block_match = self.re_block_token.match(remaining_line)
             if block_match:
                 token_key = block_match.group(1)
-                token_str = f"{token_key}:"
-                token_type = TOKEN_MAP.get(token_str)
+                token_type = BLOCK_TOKEN_MAP.get(token_key)
                 if token_type is None:
-                    token_type = TOKEN_MAP.get(token_str.lower())
+                    token_type = BLOCK_TOKEN_MAP.get(token_key.lower())
 
                 # If it's a recognized block token (from TOKEN_MAP), process it
                 if token_type is not None:
+                    token_str = f"{token_key}:"
                     match_len = len(block_match.group(0))
                     token_col_start = self.col_idx + 1
                     self.col_idx += match_len
@@ -207,136 +210,9 @@ class Lexer:
                         if self.col_idx < len(line):
                             remaining_text = line[self.col_idx :].strip()
 
-                            # Process text for inline styles if '@' is present
-                            if "@" in remaining_text:
-                                current_pos = 0
-                                text_len = len(remaining_text)
-
-                                # Find all style patterns
-                                bold_matches = list(
-                                    self.re_style_bold.finditer(remaining_text)
-                                )
-                                italic_matches = list(
-                                    self.re_style_italic.finditer(remaining_text)
-                                )
-                                code_matches = list(
-                                    self.re_style_code.finditer(remaining_text)
-                                )
-                                link_matches = list(
-                                    self.re_style_link.finditer(remaining_text)
-                                )
-
-                                # Combine all matches and sort by position
-                                all_matches = []
-                                for match in bold_matches:
-                                    all_matches.append(
-                                        (
-                                            match.start(),
-                                            match.end(),
-                                            TokenType.STYLE_BOLD,
-                                            match.group(1) or match.group(2),
-                                        )
-                                    )
-                                for match in italic_matches:
-                                    all_matches.append(
-                                        (
-                                            match.start(),
-                                            match.end(),
-                                            TokenType.STYLE_ITALIC,
-                                            match.group(1) or match.group(2),
-                                        )
-                                    )
-                                for match in code_matches:
-                                    all_matches.append(
-                                        (
-                                            match.start(),
-                                            match.end(),
-                                            TokenType.STYLE_CODE,
-                                            match.group(1) or match.group(2),
-                                        )
-                                    )
-                                for match in link_matches:
-                                    all_matches.append(
-                                        (
-                                            match.start(),
-                                            match.end(),
-                                            TokenType.STYLE_LINK,
-                                            match.group(1) or match.group(2),
-                                        )
-                                    )
-
-                                all_matches.sort()  # Sort by start position
-
-                                # Process styles if we found any
-                                if all_matches:
-                                    # Text before first style
-                                    if all_matches[0][0] > 0:
-                                        yield Token(
-                                            type=TokenType.TEXT,
-                                            value=remaining_text[: all_matches[0][0]],
-                                            line=self.line_idx + 1,
-                                            column=self.col_idx + 1,
-                                            indent_level=indent_level,
-                                        )
-
-                                    # Process each style
-                                    for i, (
-                                        start,
-                                        end,
-                                        token_type,
-                                        content,
-                                    ) in enumerate(all_matches):
-                                        # Yield the style token
-                                        yield Token(
-                                            type=token_type,
-                                            value=content,
-                                            line=self.line_idx + 1,
-                                            column=self.col_idx + start + 1,
-                                            indent_level=indent_level,
-                                        )
-
-                                        # Text between this style and the next (if any)
-                                        if i < len(all_matches) - 1:
-                                            next_start = all_matches[i + 1][0]
-                                            if next_start > end:
-                                                yield Token(
-                                                    type=TokenType.TEXT,
-                                                    value=remaining_text[
-                                                        end:next_start
-                                                    ],
-                                                    line=self.line_idx + 1,
-                                                    column=self.col_idx + end + 1,
-                                                    indent_level=indent_level,
-                                                )
-
-                                    # Text after the last style
-                                    last_end = all_matches[-1][1]
-                                    if last_end < text_len:
-                                        yield Token(
-                                            type=TokenType.TEXT,
-                                            value=remaining_text[last_end:],
-                                            line=self.line_idx + 1,
-                                            column=self.col_idx + last_end + 1,
-                                            indent_level=indent_level,
-                                        )
-                                else:
-                                    # No matches found, just yield the text
-                                    yield Token(
-                                        type=TokenType.TEXT,
-                                        value=remaining_text,
-                                        line=self.line_idx + 1,
-                                        column=self.col_idx + 1,
-                                        indent_level=indent_level,
-                                    )
-                            else:
-                                # No @ symbol, just yield as regular text
-                                yield Token(
-                                    type=TokenType.TEXT,
-                                    value=remaining_text,
-                                    line=self.line_idx + 1,
-                                    column=self.col_idx + 1,
-                                    indent_level=indent_level,
-                                )
+                            yield from self._tokenize_inline(
+                                remaining_text, self.col_idx + 1, indent_level
+                            )
                         return  # Processed indented text with potential styles
 
                     # For other block tokens
@@ -535,14 +411,13 @@ class Lexer:
             block_match = self.re_block_token.match(remaining_line)
             if block_match:
                 token_key = block_match.group(1)
-                token_str = f"{token_key}:"
-
-                token_type = TOKEN_MAP.get(token_str)
+                token_type = BLOCK_TOKEN_MAP.get(token_key)
                 if token_type is None:
-                    token_type = TOKEN_MAP.get(token_str.lower())
+                    token_type = BLOCK_TOKEN_MAP.get(token_key.lower())
 
                 # Case 1: Known Block Token
                 if token_type is not None:
+                    token_str = f"{token_key}:"
                     processed_start = True
                     match_len = len(block_match.group(0))
                     token_col_start = self.col_idx + 1
@@ -637,102 +512,96 @@ class Lexer:
                     indent_level=indent_level,
                 )
             elif text_value:  # Don't yield empty TEXT tokens
-                # Process the text for inline styles
-                current_pos = 0
-                text_len = len(text_value)
-
-                # Only try to process if there might be styles (@)
-                if "@" in text_value:
-                    # Find all style patterns
-                    bold_matches = list(self.re_style_bold.finditer(text_value))
-                    italic_matches = list(self.re_style_italic.finditer(text_value))
-                    code_matches = list(self.re_style_code.finditer(text_value))
-                    link_matches = list(self.re_style_link.finditer(text_value))
-
-                    # Combine all matches and sort by position
-                    all_matches = []
-                    for match in bold_matches:
-                        all_matches.append(
-                            (
-                                match.start(),
-                                match.end(),
-                                TokenType.STYLE_BOLD,
-                                match.group(1) or match.group(2),
-                            )
-                        )
-                    for match in italic_matches:
-                        all_matches.append(
-                            (
-                                match.start(),
-                                match.end(),
-                                TokenType.STYLE_ITALIC,
-                                match.group(1) or match.group(2),
-                            )
-                        )
-                    for match in code_matches:
-                        all_matches.append(
-                            (
-                                match.start(),
-                                match.end(),
-                                TokenType.STYLE_CODE,
-                                match.group(1) or match.group(2),
-                            )
-                        )
-                    for match in link_matches:
-                        all_matches.append(
-                            (
-                                match.start(),
-                                match.end(),
-                                TokenType.STYLE_LINK,
-                                match.group(1) or match.group(2),
-                            )
-                        )
-
-                    all_matches.sort()  # Sort by start position
+                yield from self._tokenize_inline(text_value, start_col, indent_level)
 
-                    # Process text interleaved with style tokens
-                    for start, end, token_type, content in all_matches:
-                        # Emit any text before this style
-                        if start > current_pos:
-                            yield Token(
-                                type=TokenType.TEXT,
-                                value=text_value[current_pos:start],
-                                line=self.line_idx + 1,
-                                column=start_col + current_pos,
-                                indent_level=indent_level,
-                            )
-
-                        # Emit the style token
-                        yield Token(
-                            type=token_type,
-                            value=content,
-                            line=self.line_idx + 1,
-                            column=start_col + start,
-                            indent_level=indent_level,
-                        )
+    def _tokenize_inline(
+        self, text: str, start_col: int, indent_level: int
+    ) -> Generator[Token, None, None]:
+        """
+        Split text into TEXT and inline style tokens in a single regex scan.
 
-                        # Update current position
-                        current_pos = end
+        Args:
+            text: Non-empty text that may contain @b(), @i(), @c() or @l() styles
+            start_col: Column (1-indexed) of the first character of text
+            indent_level: Indentation level recorded on the yielded tokens
 
-                    # Emit any remaining text after the last style
-                    if current_pos < text_len:
-                        yield Token(
-                            type=TokenType.TEXT,
-                            value=text_value[current_pos:],
-                            line=self.line_idx + 1,
-                            column=start_col + current_pos,
-                            indent_level=indent_level,
-                        )
+        Yields:
+            TEXT and STYLE_* tokens in source order
+        """
+        line = self.line_idx + 1
+        current_pos = 0
+
+        # Only try to process if there might be styles (@)
+        if "@" in text:
+            # Closing paren for each "(", computed only once an argument
+            # turns out to contain parens
+            closers = None
+            pos = 0
+            # One alternation pattern yields openers already in source order,
+            # so there is no per-style scan or sort
+            while match := self.re_inline_style.search(text, pos):
+                arg_start = match.end()
+                flat = self.re_inline_style_arg.match(text, arg_start)
+                if flat:
+                    arg_end = flat.end() - 1
                 else:
-                    # No styles to process, just emit the text as is
+                    if closers is None:
+                        closers = _match_parens(text)
+                    closer = closers.get(arg_start - 1)
+                    if closer is None:
+                        # Unterminated style: leave the opener as plain text
+                        pos = arg_start
+                        continue
+                    arg_end = closer
+
+                start = match.start()
+                # Emit any text before this style
+                if start > current_pos:
                     yield Token(
                         type=TokenType.TEXT,
-                        value=text_value,
-                        line=self.line_idx + 1,
-                        column=start_col,  # Use adjusted start column
+                        value=text[current_pos:start],
+                        line=line,
+                        column=start_col + current_pos,
                         indent_level=indent_level,
                     )
 
+                # Emit the style token
+                yield Token(
+                    type=STYLE_TOKEN_MAP[match.group(1)],
+                    value=text[arg_start:arg_end],
+                    line=line,
+                    column=start_col + start,
+                    indent_level=indent_level,
+                )
+                current_pos = pos = arg_end + 1
+
+        # Emit any remaining text after the last style (or the whole text)
+        if current_pos < len(text):
+            yield Token(
+                type=TokenType.TEXT,
+                value=text[current_pos:],
+                line=line,
+                column=start_col + current_pos,
+                indent_level=indent_level,
+            )
+
+
+def _match_parens(text: str) -> dict[int, int]:
+    """
+    Map the index of each balanced "(" in text to the index of its ")".
+
+    One stack pass over the whole text, so resolving any number of nested or
+    unterminated style arguments on a line stays linear.
+    """
+    closers = {}
+    opened = []
+    for idx, char in enumerate(text):
+        if char == "(":
+            opened.append(idx)
+        elif char == ")" and opened:
+            closers[opened.pop()] = idx
+    return closers
+
 
 def tokenize(content: str) -> list[Token]:
     """Convenience function to tokenize Nomenic content."""
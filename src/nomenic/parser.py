@@ -5,7 +5,8 @@
 # The parser handles both block-level elements (header, text, list, etc.) and
 # their content, including multi-line text blocks.
 
-from typing import Optional
+from collections.abc import Sequence
+from typing import ClassVar, Optional
 
 # Add other necessary AST node types
 from .ast import BlockNode, DocumentNode, HeaderNode, ListNode, TextNode
@@ -26,18 +27,68 @@ class Parser:
     - Custom directives and extensions
     """
 
-    def __init__(self, tokens: list[Token]):
+    # Block keywords whose content is handled entirely by a sub-parser: maps the
+    # keyword's token type to (parser method name, error when it returns None)
+    _BLOCK_PARSERS: ClassVar[dict[TokenType, tuple[str, str]]] = {
+        TokenType.LIST: ("_parse_list", "Expected list items after list:"),
+        TokenType.CODE: ("_parse_code_block", "Expected code content after code:"),
+        TokenType.TABLE: ("_parse_table_block", "Expected table content after table:"),
+        TokenType.DEF_LIST: (
+            "_parse_def_list_block",
+            "Expected definition terms/descriptions after def-list:",
+        ),
+        TokenType.BLOCKQUOTE: (
+            "_parse_blockquote_block",
+            "Expected quoted lines after blockquote:",
+        ),
+        TokenType.FIGURE: (
+            "_parse_figure_block",
+            "Expected figure content (src:, caption:) after figure:",
+        ),
+    }
+
+    # Block tokens that _synchronize treats as the start of a new statement
+    _SYNC_TOKEN_TYPES = frozenset(
+        {
+            TokenType.HEADER,
+            TokenType.LIST,
+            TokenType.CODE,
+            TokenType.TABLE,
+            TokenType.BLOCKQUOTE,
+            TokenType.FIGURE,
+            TokenType.CUSTOM_DIRECTIVE,
+        }
+    )
+
+    def __init__(self, tokens: Sequence[Token]):
         """
-        Initialize the parser with a list of tokens.
+        Initialize the parser with a sequence of tokens.
+
+        The parser backtracks (e.g. when a 'text:' turns out not to open a
+        multi-line block), so it needs random access rather than an iterator.
+        Any already-materialized sequence works; there is no need to copy the
+        lexer's list.
 
         Args:
-            tokens: List of Token objects from the lexer
+            tokens: Sequence of Token objects from the lexer
+        """
+        self.strict_mode = False  # If True, errors will raise exceptions
+        self.reset(tokens)
+
+    def reset(self, tokens: Sequence[Token]) -> None:
+        """
+        Point the parser at a new token sequence and clear per-document state.
+
+        Lets one parser be reused across documents; the strict mode setting
+        is kept.
+
+        Args:
+            tokens: Sequence of Token objects from the lexer
         """
         self.tokens = tokens
         self.position = 0
         # List of (message, token) tuples
         self.errors: list[tuple[str, Token]] = []
-        self.strict_mode = False  # If True, errors will raise exceptions
         # Track current indentation level for validation
         self.current_indent_level = 0
         # Track document metadata
@@ -104,15 +155,7 @@ class Parser:
                 return
 
             # Block tokens typically start new statements
-            if current.type in (
-                TokenType.HEADER,
-                TokenType.LIST,
-                TokenType.CODE,
-                TokenType.TABLE,
-                TokenType.BLOCKQUOTE,
-                TokenType.FIGURE,
-                TokenType.CUSTOM_DIRECTIVE,
-            ):
+            if current.type in self._SYNC_TOKEN_TYPES:
                 return
 
             self._advance()
@@ -212,7 +255,17 @@ class Parser:
                 continue
 
             # Parse other block types
-            if token.type == TokenType.HEADER:
+            block_parser = self._BLOCK_PARSERS.get(token.type)
+            if block_parser is not None:
+                method_name, error_msg = block_parser
+                self._advance()  # Skip the block keyword token
+                node = getattr(self, method_name)()
+                if node:
+                    document.children.append(node)
+                else:
+                    self._error(error_msg, token)
+                    self._synchronize()
+            elif token.type == TokenType.HEADER:
                 self._advance()  # Skip the 'header:' token
                 value_token = self._peek()
                 # Check if there's content after the header and it's not empty
@@ -241,40 +294,6 @@ class Parser:
                     ):
                         self._advance()  # Skip the comment
                     self._synchronize()
-            elif token.type == TokenType.LIST:
-                self._advance()  # Skip the 'list:' token
-                node = self._parse_list()
-                if node:
-                    document.children.append(node)
-                else:
-                    self._error("Expected list items after list:", token)
-                    self._synchronize()
-            elif token.type == TokenType.CODE:
-                self._advance()  # Skip the 'code:' token
-                node = self._parse_code_block()
-                if node:
-                    document.children.append(node)
-                else:
-                    self._error("Expected code content after code:", token)
-                    self._synchronize()
-            elif token.type == TokenType.TABLE:
-                self._advance()  # Skip the 'table:' token
-                node = self._parse_table_block()
-                if node:
-                    document.children.append(node)
-                else:
-                    self._error("Expected table content after table:", token)
-                    self._synchronize()
-            elif token.type == TokenType.DEF_LIST:
-                self._advance()  # Skip the 'def-list:' token
-                node = self._parse_def_list_block()
-                if node:
-                    document.children.append(node)
-                else:
-                    self._error(
-                        "Expected definition terms/descriptions after def-list:", token
-                    )
-                    self._synchronize()
             elif token.type == TokenType.CALLOUT:
                 self._advance()  # Skip the 'note:' or 'warn:' token
                 value_token = self._peek()
@@ -288,24 +307,6 @@ class Parser:
                 else:
                     self._error("Expected callout content after note:/warn:", token)
                     self._synchronize()
-            elif token.type == TokenType.BLOCKQUOTE:
-                self._advance()  # Skip the 'blockquote:' token
-                node = self._parse_blockquote_block()
-                if node:
-                    document.children.append(node)
-                else:
-                    self._error("Expected quoted lines after blockquote:", token)
-                    self._synchronize()
-            elif token.type == TokenType.FIGURE:
-                self._advance()  # Skip the 'figure:' token
-                node = self._parse_figure_block()
-                if node:
-                    document.children.append(node)
-                else:
-                    self._error(
-                        "Expected figure content (src:, caption:) after figure:", token
-                    )
-                    self._synchronize()
             elif token.type == TokenType.CUSTOM_DIRECTIVE:
                 directive_name = token.value.rstrip(":") if token.value else "custom"
                 self._advance()  # Skip the 'x-foo:' token
@@ -800,13 +801,12 @@ class Parser:
         if value_token and value_token.type == TokenType.TEXT and value_token.value:
             # Process meta key-value pairs
             meta_text = value_token.value.strip()
-            meta_pairs = meta_text.split(",")
 
             # Create a metadata dictionary
             meta_dict = {}
 
-            for raw_item in meta_pairs:
-                clean_item = raw_item.strip()
+            # map(str.strip, ...) strips each pair without a Python-level frame
+            for clean_item in map(str.strip, meta_text.split(",")):
                 if "=" in clean_item:
                     key, value = clean_item.split("=", 1)
                     meta_dict[key.strip()] = value.strip()
@@ -882,7 +882,7 @@ class Parser:
     #     pass
 
 
-def parse(tokens: list[Token]) -> DocumentNode:
+def parse(tokens: Sequence[Token]) -> DocumentNode:
     """
     Parse a stream of tokens into a DocumentNode.
 
@@ -890,7 +890,7 @@ def parse(tokens: list[Token]) -> DocumentNode:
     parse method.
 
     Args:
-        tokens: A list of Token objects from the lexer
+        tokens: A sequence of Token objects from the lexer
 
     Returns:
         DocumentNode containing the full parsed AST
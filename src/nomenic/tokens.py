@@ -1,12 +1,23 @@
 # Nomenic Core - Token Definitions
 
+import sys
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Any, Optional
 
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_DATACLASS_SLOTS: dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
 
-class TokenType(Enum):
-    """Enum representing the different types of tokens in Nomenic Core."""
+
+class TokenType(IntEnum):
+    """
+    Enum representing the different types of tokens in Nomenic Core.
+
+    An IntEnum so members hash and compare as plain ints, which keeps the
+    per-token type checks in the lexer and parser cheap.
+    """
 
     # Block level tokens
     META = auto()
@@ -47,8 +58,16 @@ class TokenType(Enum):
     WHITESPACE = auto()
     EOF = auto()
 
+    # Render as "TokenType.META" rather than int's "1"; IntEnum's str() and
+    # format() differ between Python versions, so define both explicitly
+    def __str__(self) -> str:
+        return f"TokenType.{self.name}"
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class Token:
     """
     Represents a token in Nomenic Core syntax.
@@ -59,7 +78,8 @@ class Token:
         line: Line number in source (1-indexed)
         column: Column number in source (1-indexed)
         indent_level: Indentation level (0 for root level)
-        metadata: Optional additional data for the token
+        metadata: Optional additional data for the token; None unless the
+            lexer has something to attach, so most tokens carry no dict
     """
 
     type: TokenType
@@ -116,5 +136,23 @@ TOKEN_MAP = {
     "\\\\": TokenType.ESCAPE,
 }
 
+# TOKEN_MAP's "key:" entries keyed by the bare key, matching the lexer's
+# re_block_token group so a line can be classified without building "key:"
+BLOCK_TOKEN_MAP = {
+    key[:-1]: token_type for key, token_type in TOKEN_MAP.items() if key.endswith(":")
+}
+
+# Maps inline style names (as in @b(...) or @bold(...)) to their token types
+STYLE_TOKEN_MAP = {
+    "b": TokenType.STYLE_BOLD,
+    "bold": TokenType.STYLE_BOLD,
+    "i": TokenType.STYLE_ITALIC,
+    "italic": TokenType.STYLE_ITALIC,
+    "c": TokenType.STYLE_CODE,
+    "code": TokenType.STYLE_CODE,
+    "l": TokenType.STYLE_LINK,
+    "link": TokenType.STYLE_LINK,
+}
+
 # Patterns that need to be matched rather than exact strings
 # These will be implemented in the lexer with regex
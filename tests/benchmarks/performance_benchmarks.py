@@ -7,12 +7,14 @@ It uses the pytest-benchmark package for timing and statistics.
 import os
 import random
 import string
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import pytest
 from nomenic.lexer import tokenize
 from nomenic.parser import parse
+from nomenic.tokens import Token
 
 # Constants - adjusted for more realistic test sizes
 SMALL_DOC_SIZE = 500  # ~0.5KB
@@ -23,57 +25,83 @@ VERY_LARGE_DOC_SIZE = 10_000  # ~10KB
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 BENCHMARK_DIR = Path(__file__).parent / "benchmark_data"
 
+# Set to 1/true/yes to regenerate benchmark files instead of reusing the ones
+# on disk; any other value (including 0) keeps them
+_TRUE_ENV_VALUES = {"1", "true", "yes"}
+REGENERATE_BENCHMARK_FILES = (
+    os.environ.get("NOMENIC_BENCH_REGEN", "").lower() in _TRUE_ENV_VALUES
+)
+
+# Benchmark document content by size, so each file is read (or generated) once
+_BENCH_CACHE: dict[int, str] = {}
+
+
+# Characters drawn for random benchmark text. No newlines or tabs: the text
+# must never start a line with whitespace, which the lexer reads as indentation
+RANDOM_TEXT_ALPHABET = string.ascii_letters + string.digits + " .,!?"
+
+# Fixed fragments of generated documents, encoded once rather than per section
+_SECTION_HEADER = b"header: Benchmark Section %d\n"
+_TEXT_BLOCK_START = b"text:\n>>>\n"
+_TEXT_BLOCK_END = b"\n<<<\n"
+_LIST_START = b"list:\n"
+# Section lists have 1-3 items; entry n holds the lines for an n-item list
+_LIST_ITEMS = [
+    b"".join(b"- List item %d with some text\n" % (i + 1) for i in range(n))
+    for n in range(4)
+]
+_CODE_BLOCK = b"code:\n  def example():\n      return 'Hello, world!'\n"
+
 
 # Helper functions
-def generate_random_text(length: int) -> str:
-    """Generate random text of specified length."""
-    return "".join(
-        random.choice(string.ascii_letters + string.digits + " \n\t.,!?")
-        for _ in range(length)
-    )
+def generate_random_text(length: int, rng: random.Random) -> str:
+    """Generate random single-line text of specified length, starting with a letter."""
+    if length <= 0:
+        return ""
+    first = rng.choice(string.ascii_letters)
+    return first + "".join(rng.choices(RANDOM_TEXT_ALPHABET, k=length - 1))
+
 
+def generate_nomenic_bytes(size: int) -> bytearray:
+    """Generate the ASCII bytes of a Nomenic document of approximately size."""
+    # Generated text is ASCII-only, so accumulate bytes in one growable buffer
+    # instead of keeping a list of parts to join
+    buf = bytearray()
+    # Seeded by size so every run generates the same document for a given size
+    rng = random.Random(size)
 
-def generate_nomenic_doc(size: int) -> str:
-    """Generate a Nomenic document of approximately the specified size."""
-    doc_parts = [
-        "meta: version=1.0.0, author=BenchmarkGenerator\n",
-        "header: Performance Benchmark Document\n",
-        f"text: Generated document with approximately {size} characters\n",
-    ]
+    def add(part: str) -> None:
+        buf.extend(part.encode("ascii"))
+
+    add("meta: version=1.0.0, author=BenchmarkGenerator\n")
+    add("header: Performance Benchmark Document\n")
+    add(f"text: Generated document with approximately {size} characters\n")
 
     # Generate sections with random content to reach the target size
-    current_size = sum(len(part) for part in doc_parts)
     section_count = 1
 
-    while current_size < size:
+    while len(buf) < size:
         # Add a section
-        section_name = f"Benchmark Section {section_count}"
-        doc_parts.append(f"header: {section_name}\n")
+        buf += _SECTION_HEADER % section_count
 
         # Add some text content - keep text blocks smaller
-        text_size = min(random.randint(50, 200), size - current_size)
+        text_size = min(rng.randint(50, 200), size - len(buf))
         if text_size > 0:
-            doc_parts.append("text:\n>>>\n")
-            doc_parts.append(generate_random_text(text_size))
-            doc_parts.append("\n<<<\n")
+            buf += _TEXT_BLOCK_START
+            add(generate_random_text(text_size, rng))
+            buf += _TEXT_BLOCK_END
 
         # Add a list - limit list items
-        doc_parts.append("list:\n")
-        list_items = random.randint(1, 3)
-        for i in range(list_items):
-            doc_parts.append(f"- List item {i+1} with some text\n")
+        buf += _LIST_START
+        buf += _LIST_ITEMS[rng.randint(1, 3)]
 
         # Maybe add a code block
-        if random.random() > 0.7:
-            doc_parts.append("code:\n")
-            doc_parts.append("  def example():\n")
-            doc_parts.append("      return 'Hello, world!'\n")
+        if rng.random() > 0.7:
+            buf += _CODE_BLOCK
 
-        # Update size tracking
-        current_size = sum(len(part) for part in doc_parts)
         section_count += 1
 
-    return "".join(doc_parts)
+    return buf
 
 
 def ensure_benchmark_dir() -> None:
@@ -83,16 +111,32 @@ def ensure_benchmark_dir() -> None:
 
 def get_or_create_benchmark_file(size: int) -> str:
     """Get the content of a benchmark file or create it if it doesn't exist."""
+    if size in _BENCH_CACHE:
+        return _BENCH_CACHE[size]
+
     ensure_benchmark_dir()
     file_path = BENCHMARK_DIR / f"benchmark_{size}.nmc"
 
-    if not file_path.exists():
-        print(f"Generating benchmark file: {file_path}")
-        content = generate_nomenic_doc(size)
-        file_path.write_text(content)
-        return content
+    if file_path.exists() and not REGENERATE_BENCHMARK_FILES:
+        content = file_path.read_text()
+    else:
+        # Write the generated bytes directly; write_text would re-encode content
+        buf = generate_nomenic_bytes(size)
+        file_path.write_bytes(buf)
+        content = buf.decode("ascii")
+
+    _BENCH_CACHE[size] = content
+    return content
+
 
-    return file_path.read_text()
+@cache
+def get_benchmark_tokens(size: int) -> list[Token]:
+    """Tokenize the benchmark document of the given size once, on first use.
+
+    Per size rather than in one fixture, so a parser benchmark only depends on
+    its own document lexing.
+    """
+    return tokenize(get_or_create_benchmark_file(size))
 
 
 # Benchmarks
@@ -117,27 +161,38 @@ def test_lexer_large(benchmark: Any) -> None:
     benchmark(tokenize, content)
 
 
+@pytest.mark.benchmark(group="lexer")
+def test_lexer_very_large(benchmark: Any) -> None:
+    """Benchmark the lexer with a very large document (~10KB)."""
+    content = get_or_create_benchmark_file(VERY_LARGE_DOC_SIZE)
+    benchmark(tokenize, content)
+
+
 @pytest.mark.benchmark(group="parser")
 def test_parser_small(benchmark: Any) -> None:
     """Benchmark the parser with a small document (~0.5KB)."""
-    content = get_or_create_benchmark_file(SMALL_DOC_SIZE)
-    tokens = tokenize(content)
+    tokens = get_benchmark_tokens(SMALL_DOC_SIZE)
     benchmark(parse, tokens)
 
 
 @pytest.mark.benchmark(group="parser")
 def test_parser_medium(benchmark: Any) -> None:
     """Benchmark the parser with a medium document (~2KB)."""
-    content = get_or_create_benchmark_file(MEDIUM_DOC_SIZE)
-    tokens = tokenize(content)
+    tokens = get_benchmark_tokens(MEDIUM_DOC_SIZE)
     benchmark(parse, tokens)
 
 
 @pytest.mark.benchmark(group="parser")
 def test_parser_large(benchmark: Any) -> None:
     """Benchmark the parser with a large document (~5KB)."""
-    content = get_or_create_benchmark_file(LARGE_DOC_SIZE)
-    tokens = tokenize(content)
+    tokens = get_benchmark_tokens(LARGE_DOC_SIZE)
+    benchmark(parse, tokens)
+
+
+@pytest.mark.benchmark(group="parser")
+def test_parser_very_large(benchmark: Any) -> None:
+    """Benchmark the parser with a very large document (~10KB)."""
+    tokens = get_benchmark_tokens(VERY_LARGE_DOC_SIZE)
     benchmark(parse, tokens)
 
 
@@ -175,17 +230,19 @@ def test_memory_usage() -> None:
     for size in [SMALL_DOC_SIZE, MEDIUM_DOC_SIZE, LARGE_DOC_SIZE]:
         content = get_or_create_benchmark_file(size)
 
-        # Measure lexer memory usage
+        # Measure lexer and parser in one tracing session; reset_peak() between
+        # them, so the parser's peak is taken on top of the tokens it holds
         tracemalloc.start()
         tokens = tokenize(content)
         lexer_current, lexer_peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        # Measure parser memory usage
-        tracemalloc.start()
+        tracemalloc.reset_peak()
         parse(tokens)
-        parser_current, parser_peak = tracemalloc.get_traced_memory()
+        _, peak = tracemalloc.get_traced_memory()
         tracemalloc.stop()
+        del tokens
+
+        # Report the parser's own allocations, excluding the token baseline
+        parser_peak = peak - lexer_current
 
         results.append(
             {
@@ -1,29 +1,90 @@
 """Common test fixtures and configurations."""
 
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from src.nomenic.lexer import Lexer
+from src.nomenic.tokens import Token
 
-@pytest.fixture
+# Resolved once at import; the path fixtures below only hand out these constants
+_TEST_DATA_DIR = Path(__file__).parent / "fixtures"
+_SAMPLE_NMC_FILE = _TEST_DATA_DIR / "sample.nmc"
+_INVALID_NMC_FILE = _TEST_DATA_DIR / "invalid.nmc"
+_EMPTY_NMC_FILE = _TEST_DATA_DIR / "empty.nmc"
+
+
+@pytest.fixture(scope="session")
 def test_data_dir() -> Path:
     """Return the path to the test data directory."""
-    return Path(__file__).parent / "fixtures"
+    return _TEST_DATA_DIR
 
 
-@pytest.fixture
-def sample_nmc_file(test_data_dir: Path) -> Path:
+@pytest.fixture(scope="session")
+def sample_nmc_file() -> Path:
     """Return the path to a sample Nomenic Core file."""
-    return test_data_dir / "sample.nmc"
+    return _SAMPLE_NMC_FILE
+
+
+@pytest.fixture(scope="session")
+def sample_document() -> str:
+    """Return the contents of the sample Nomenic Core file, read once per session."""
+    return _SAMPLE_NMC_FILE.read_text(encoding="utf-8")
+
 
+@pytest.fixture(scope="session")
+def sample_tokens(sample_document: str) -> list[Token]:
+    """Return the sample document's tokens, lexed once and shared (read-only)."""
+    return Lexer(sample_document).tokenize()
 
-@pytest.fixture
-def invalid_nmc_file(test_data_dir: Path) -> Path:
+
+@pytest.fixture(scope="session")
+def invalid_nmc_file() -> Path:
     """Return the path to an invalid Nomenic Core file."""
-    return test_data_dir / "invalid.nmc"
+    return _INVALID_NMC_FILE
 
 
-@pytest.fixture
-def empty_nmc_file(test_data_dir: Path) -> Path:
+@pytest.fixture(scope="session")
+def empty_nmc_file() -> Path:
     """Return the path to an empty Nomenic Core file."""
-    return test_data_dir / "empty.nmc"
+    return _EMPTY_NMC_FILE
+
+
+@pytest.fixture(scope="session")
+def invalid_document() -> str:
+    """Return the contents of the invalid Nomenic Core file, read once per session."""
+    return _INVALID_NMC_FILE.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def empty_document() -> str:
+    """Return the contents of the empty Nomenic Core file, read once per session."""
+    return _EMPTY_NMC_FILE.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def parse_cached() -> Callable[[str], Any]:
+    """Return a memoized parse(tokenize(source)) shared by the whole session.
+
+    Each distinct source is lexed and parsed once; the returned document is
+    shared, so tests must only read it.
+    """
+    # Imported here, not at module level: parser tests import the installed
+    # nomenic package, and the AST classes must come from that same module
+    from nomenic.lexer import tokenize
+    from nomenic.parser import parse
+
+    @lru_cache(maxsize=256)
+    def _parse(source: str) -> Any:
+        return parse(tokenize(source))
+
+    return _parse
+
+
+@pytest.fixture(scope="session")
+def parsed_document(sample_document: str, parse_cached: Callable[[str], Any]) -> Any:
+    """Return the sample document's AST, parsed once and shared (read-only)."""
+    return parse_cached(sample_document)
@@ -6,6 +6,11 @@ the lexer and parser's robustness against varied inputs.
 
 import string
 
+import pytest
+
+# Skip the module at collection time when Hypothesis is not installed
+pytest.importorskip("hypothesis")
+
 from hypothesis import given, settings
 from hypothesis import strategies as st
 from nomenic.ast import DocumentNode
@@ -55,9 +60,7 @@ block_types = st.sampled_from(
 
 @st.composite
 def block_line(draw):
-    indent = draw(indentation)
-    block_type = draw(block_types)
-    content = draw(simple_line)
+    indent, block_type, content = draw(st.tuples(indentation, block_types, simple_line))
     return f"{indent}{block_type} {content}"
 
 
@@ -66,8 +69,7 @@ def block_line(draw):
 
 @st.composite
 def list_item(draw):
-    indent = draw(indentation)
-    content = draw(simple_line)
+    indent, content = draw(st.tuples(indentation, simple_line))
     return f"{indent}- {content}"
 
 
@@ -76,8 +78,7 @@ def list_item(draw):
 
 @st.composite
 def row_item(draw):
-    indent = draw(indentation)
-    content = draw(simple_line)
+    indent, content = draw(st.tuples(indentation, simple_line))
     return f"{indent}- row: {content}"
 
 
@@ -86,22 +87,23 @@ def row_item(draw):
 
 @st.composite
 def multi_part_block(draw):
-    indent = draw(indentation)
-    block_type = draw(st.sampled_from(["def-list:", "figure:"]))
+    indent, block_type = draw(
+        st.tuples(indentation, st.sampled_from(["def-list:", "figure:"]))
+    )
     lines = [f"{indent}{block_type}"]
 
     # For def-list, add dt and dd pairs
     if block_type == "def-list:":
-        for _ in range(draw(st.integers(min_value=1, max_value=3))):
-            term = draw(simple_line)
-            definition = draw(simple_line)
+        pairs = draw(
+            st.lists(st.tuples(simple_line, simple_line), min_size=1, max_size=3)
+        )
+        for term, definition in pairs:
             lines.append(f"{indent}dt: {term}")
             lines.append(f"{indent}dd: {definition}")
 
     # For figure, add src and caption
     elif block_type == "figure:":
-        src = draw(simple_line)
-        caption = draw(simple_line)
+        src, caption = draw(st.tuples(simple_line, simple_line))
         lines.append(f"{indent}  src: {src}")
         lines.append(f"{indent}  caption: {caption}")
 
@@ -119,38 +121,28 @@ def nomenic_document(draw):
         "header: Generated Test Document",
     ]
 
-    # Add a random number of blocks
-    num_blocks = draw(st.integers(min_value=0, max_value=10))
-    for _ in range(num_blocks):
-        block_choice = draw(st.integers(min_value=0, max_value=5))
-
+    # Draw all block choices at once rather than one draw per block
+    block_choices = draw(st.lists(st.integers(min_value=0, max_value=5), max_size=10))
+    for block_choice in block_choices:
         if block_choice == 0:
             # Simple block
             doc_parts.append(draw(block_line()))
         elif block_choice == 1:
             # List block
-            block = ["list:"]
-            num_items = draw(st.integers(min_value=1, max_value=5))
-            for _ in range(num_items):
-                block.append(draw(list_item()))
+            block = ["list:", *draw(st.lists(list_item(), min_size=1, max_size=5))]
             doc_parts.append("\n".join(block))
         elif block_choice == 2:
             # Table block
-            block = ["table:"]
-            num_rows = draw(st.integers(min_value=1, max_value=3))
-            for _ in range(num_rows):
-                block.append(draw(row_item()))
+            block = ["table:", *draw(st.lists(row_item(), min_size=1, max_size=3))]
             doc_parts.append("\n".join(block))
         elif block_choice == 3:
             # Multi-line text block
-            indent = draw(indentation)
-            content = draw(text_content)
+            indent, content = draw(st.tuples(indentation, text_content))
             block = [f"{indent}text:", f"{indent}>>>", content, f"{indent}<<<"]
             doc_parts.append("\n".join(block))
         elif block_choice == 4:
             # Code block
-            indent = draw(indentation)
-            content = draw(text_content)
+            indent, content = draw(st.tuples(indentation, text_content))
             # Format content as code with proper indentation
             formatted_content = "\n".join(
                 f"{indent}  {line}" for line in content.split("\n")
@@ -1,3 +1,5 @@
+import pytest
+
 from src.nomenic.errors import (
     ExtensionError,
     LexerError,
@@ -7,18 +9,20 @@ from src.nomenic.errors import (
     ValidationError,
 )
 
+ERROR_CLASSES = [
+    LexerError,
+    ParserError,
+    ValidationError,
+    MigrationError,
+    ExtensionError,
+]
+
 
-def test_nomenic_error_inheritance():
-    assert issubclass(LexerError, NomenicError)  # nosec B101
-    assert issubclass(ParserError, NomenicError)  # nosec B101
-    assert issubclass(ValidationError, NomenicError)  # nosec B101
-    assert issubclass(MigrationError, NomenicError)  # nosec B101
-    assert issubclass(ExtensionError, NomenicError)  # nosec B101
+@pytest.mark.parametrize("error_class", ERROR_CLASSES)
+def test_nomenic_error_inheritance(error_class):
+    assert issubclass(error_class, NomenicError)  # nosec B101
 
 
-def test_error_instantiation():
-    assert str(LexerError("msg")) == "msg"  # nosec B101
-    assert str(ParserError("msg")) == "msg"  # nosec B101
-    assert str(ValidationError("msg")) == "msg"  # nosec B101
-    assert str(MigrationError("msg")) == "msg"  # nosec B101
-    assert str(ExtensionError("msg")) == "msg"  # nosec B101
+@pytest.mark.parametrize("error_class", ERROR_CLASSES)
+def test_error_instantiation(error_class):
+    assert str(error_class("msg")) == "msg"  # nosec B101
@@ -1,5 +1,7 @@
 """Tests for the Nomenic Core lexer."""
 
+from collections import defaultdict
+
 import pytest
 
 from src.nomenic.errors import LexerError
@@ -12,6 +14,7 @@ EXPECTED_MIN_CALLOUT_TOKENS = 3
 EXPECTED_MIN_CUSTOM_TOKENS = 2
 EXPECTED_MIN_STYLE_TOKENS = 4
 EOF_TOKEN_COUNT = 1
+UNTERMINATED_STYLE_COUNT = 200
 
 
 def test_lexer_initialization():
@@ -24,172 +27,128 @@ def test_lexer_initialization():
     assert lexer.col_idx == 0
 
 
-def test_lexer_tokenizes_meta(sample_nmc_file):
-    """Test that the lexer correctly tokenizes meta information."""
-    with open(sample_nmc_file) as f:
-        content = f.read()
-
-    lexer = Lexer(content)
-    tokens = list(lexer.tokenize())
-
-    # Find meta tokens
-    meta_tokens = [t for t in tokens if t.type == TokenType.META]
-    assert len(meta_tokens) > 0
-    assert any(t.value == "meta:" for t in meta_tokens)
-
-
-def test_lexer_tokenizes_header(sample_nmc_file):
-    """Test that the lexer correctly tokenizes headers."""
-    with open(sample_nmc_file) as f:
-        content = f.read()
-
-    lexer = Lexer(content)
-    tokens = list(lexer.tokenize())
-
-    # Find header tokens
-    header_tokens = [t for t in tokens if t.type == TokenType.HEADER]
-    assert len(header_tokens) > 0
-    assert any(t.value == "header:" for t in header_tokens)
-
-
-def test_lexer_tokenizes_list_items(sample_nmc_file):
-    """Test that the lexer correctly tokenizes list items."""
-    with open(sample_nmc_file) as f:
-        content = f.read()
-
-    lexer = Lexer(content)
-    tokens = list(lexer.tokenize())
-
-    # Find list item tokens
-    list_items = [t for t in tokens if t.type == TokenType.LIST_ITEM]
-    assert len(list_items) >= EXPECTED_MIN_LIST_ITEMS
-    assert any(t.value == "- " for t in list_items)
-
-
-def test_lexer_tokenizes_code_blocks(sample_nmc_file):
+@pytest.fixture(scope="module")
+def sample_tokens_by_type(sample_tokens):
+    """Group the sample document's tokens by type in a single pass."""
+    tokens_by_type = defaultdict(list)
+    for token in sample_tokens:
+        tokens_by_type[token.type].append(token)
+    return tokens_by_type
+
+
+@pytest.mark.parametrize(
+    ("token_type", "min_count", "expected_values"),
+    [
+        pytest.param(TokenType.META, 1, ["meta:"], id="meta"),
+        pytest.param(TokenType.HEADER, 1, ["header:"], id="header"),
+        pytest.param(
+            TokenType.LIST_ITEM, EXPECTED_MIN_LIST_ITEMS, ["- "], id="list_items"
+        ),
+        pytest.param(
+            TokenType.CALLOUT,
+            EXPECTED_MIN_CALLOUT_TOKENS,
+            ["note:", "warn:", "tip:"],
+            id="callouts",
+        ),
+        pytest.param(
+            TokenType.CUSTOM_DIRECTIVE,
+            EXPECTED_MIN_CUSTOM_TOKENS,
+            ["x-custom:", "x-another:"],
+            id="custom_directives",
+        ),
+    ],
+)
+def test_lexer_tokenizes_block_tokens(
+    sample_tokens_by_type, token_type, min_count, expected_values
+):
+    """Test that the lexer tokenizes each block keyword in the sample document."""
+    tokens = sample_tokens_by_type[token_type]
+    assert len(tokens) >= min_count
+    values = {t.value for t in tokens}
+    for expected_value in expected_values:
+        assert expected_value in values
+
+
+def test_lexer_tokenizes_code_blocks(sample_tokens_by_type):
     """Test that the lexer correctly tokenizes code blocks."""
-    with open(sample_nmc_file) as f:
-        content = f.read()
-
-    lexer = Lexer(content)
-    tokens = list(lexer.tokenize())
-
-    # Find code tokens
-    code_tokens = [t for t in tokens if t.type == TokenType.CODE]
+    code_tokens = sample_tokens_by_type[TokenType.CODE]
     assert len(code_tokens) > 0
     assert any("def hello_world():" in t.value for t in code_tokens)
 
 
-def test_lexer_tokenizes_callouts(sample_nmc_file):
-    """Test that the lexer correctly tokenizes callouts."""
-    with open(sample_nmc_file) as f:
-        content = f.read()
-
-    lexer = Lexer(content)
-    tokens = list(lexer.tokenize())
-
-    # Find callout tokens
-    callout_tokens = [t for t in tokens if t.type == TokenType.CALLOUT]
-    assert len(callout_tokens) >= EXPECTED_MIN_CALLOUT_TOKENS
-    assert any(t.value == "note:" for t in callout_tokens)
-    assert any(t.value == "warn:" for t in callout_tokens)
-    assert any(t.value == "tip:" for t in callout_tokens)
-
-
-def test_lexer_tokenizes_custom_directives(sample_nmc_file):
-    """Test that the lexer correctly tokenizes custom directives."""
-    with open(sample_nmc_file) as f:
-        content = f.read()
-
-    lexer = Lexer(content)
-    tokens = list(lexer.tokenize())
-
-    # Find custom directive tokens
-    custom_tokens = [t for t in tokens if t.type == TokenType.CUSTOM_DIRECTIVE]
-    assert len(custom_tokens) >= EXPECTED_MIN_CUSTOM_TOKENS
-    assert any(t.value == "x-custom:" for t in custom_tokens)
-    assert any(t.value == "x-another:" for t in custom_tokens)
-
-
-def test_lexer_tokenizes_inline_styles(sample_nmc_file):
+def test_lexer_tokenizes_inline_styles(sample_tokens_by_type):
     """Test that the lexer correctly tokenizes inline styles."""
-    with open(sample_nmc_file) as f:
-        content = f.read()
-
-    lexer = Lexer(content)
-    tokens = list(lexer.tokenize())
-
-    # Find style tokens
-    style_tokens = [
-        t
-        for t in tokens
-        if t.type
-        in (
-            TokenType.STYLE_BOLD,
-            TokenType.STYLE_ITALIC,
-            TokenType.STYLE_CODE,
-            TokenType.STYLE_LINK,
-        )
-    ]
-    assert len(style_tokens) >= EXPECTED_MIN_STYLE_TOKENS
-    assert any(t.type == TokenType.STYLE_BOLD for t in style_tokens)
-    assert any(t.type == TokenType.STYLE_ITALIC for t in style_tokens)
-    assert any(t.type == TokenType.STYLE_CODE for t in style_tokens)
-    assert any(t.type == TokenType.STYLE_LINK for t in style_tokens)
-
-
-def test_lexer_handles_invalid_indentation(invalid_nmc_file):
+    style_types = (
+        TokenType.STYLE_BOLD,
+        TokenType.STYLE_ITALIC,
+        TokenType.STYLE_CODE,
+        TokenType.STYLE_LINK,
+    )
+    style_count = sum(len(sample_tokens_by_type[t]) for t in style_types)
+    assert style_count >= EXPECTED_MIN_STYLE_TOKENS
+    for style_type in style_types:
+        assert sample_tokens_by_type[style_type]
+
+
+def test_lexer_handles_invalid_indentation(invalid_document):
     """Test that the lexer correctly handles invalid indentation."""
-    with open(invalid_nmc_file) as f:
-        content = f.read()
-
-    lexer = Lexer(content)
+    lexer = Lexer(invalid_document)
     with pytest.raises(LexerError, match="Invalid indentation"):
-        list(lexer.tokenize())
+        lexer.tokenize()
 
 
-def test_lexer_handles_invalid_list_syntax(invalid_nmc_file):
+def test_lexer_handles_invalid_list_syntax(invalid_document):
     """Test that the lexer correctly handles invalid list syntax."""
     # NOTE: This test might need adjustment based on how the lexer
     # handles list errors after refactoring.
-    with open(invalid_nmc_file) as f:
-        content = f.read()
-
-    lexer = Lexer(content)
-    with pytest.raises(LexerError):
-        list(lexer.tokenize())
+    lexer = Lexer(invalid_document)
+    with pytest.raises(LexerError, match="Invalid indentation"):
+        lexer.tokenize()
 
 
-def test_lexer_handles_invalid_custom_directives(invalid_nmc_file):
+def test_lexer_handles_invalid_custom_directives(invalid_document):
     """Test that the lexer correctly handles invalid custom directives."""
     # NOTE: This test might need adjustment based on how the lexer
     # handles custom directive errors after refactoring.
-    with open(invalid_nmc_file) as f:
-        content = f.read()
-
-    lexer = Lexer(content)
-    with pytest.raises(LexerError):
-        list(lexer.tokenize())
+    lexer = Lexer(invalid_document)
+    with pytest.raises(LexerError, match="Invalid indentation"):
+        lexer.tokenize()
 
 
-def test_lexer_handles_invalid_inline_styles(invalid_nmc_file):
+def test_lexer_handles_invalid_inline_styles(invalid_document):
     """Test that the lexer correctly handles invalid inline styles."""
     # NOTE: This test might need adjustment based on how the lexer
     # handles inline style errors after refactoring.
-    with open(invalid_nmc_file) as f:
-        content = f.read()
-
-    lexer = Lexer(content)
-    with pytest.raises(LexerError):
-        list(lexer.tokenize())
+    lexer = Lexer(invalid_document)
+    with pytest.raises(LexerError, match="Invalid indentation"):
+        lexer.tokenize()
 
 
-def test_lexer_handles_empty_file(empty_nmc_file):
+def test_lexer_handles_empty_file(empty_document):
     """Test that the lexer correctly handles empty files."""
-    with open(empty_nmc_file) as f:
-        content = f.read()
-
-    lexer = Lexer(content)
-    tokens = list(lexer.tokenize())
+    lexer = Lexer(empty_document)
+    tokens = lexer.tokenize()
     assert len(tokens) == EOF_TOKEN_COUNT  # Only EOF token
     assert tokens[0].type == TokenType.EOF
+
+
+def test_lexer_inline_styles_allow_nested_parens():
+    """Test that a style argument may contain nested styles and annotations."""
+    tokens = Lexer("text: @b(@i(nested)) and @b(see (note))").tokenize()
+
+    style_tokens = [
+        t for t in tokens if t.type in (TokenType.STYLE_BOLD, TokenType.STYLE_ITALIC)
+    ]
+    assert [(t.type, t.value) for t in style_tokens] == [
+        (TokenType.STYLE_BOLD, "@i(nested)"),
+        (TokenType.STYLE_BOLD, "see (note)"),
+    ]
+
+
+def test_lexer_handles_unterminated_inline_styles():
+    """Test that many unterminated styles are left as a single text token."""
+    text = "@b(" * UNTERMINATED_STYLE_COUNT
+    tokens = Lexer("text: " + text).tokenize()
+
+    # Block keyword, the untouched style text, then EOF
+    assert [(t.type, t.value) for t in tokens[1:-1]] == [(TokenType.TEXT, text)]
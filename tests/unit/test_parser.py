@@ -1,6 +1,4 @@
 from nomenic.ast import BlockNode, DocumentNode, HeaderNode, ListNode, TextNode
-from nomenic.lexer import tokenize
-from nomenic.parser import parse
 
 # Constants for test assertions
 HEADER_AND_TEXT_COUNT = 2
@@ -13,13 +11,12 @@ CUSTOM_DIRECTIVE_PARTS_COUNT = 1
 DEF_LIST_PARTS_COUNT = 4
 
 
-def test_parse_header_and_text():
+def test_parse_header_and_text(parse_cached):
     source = """
 header: Welcome to Nomenic
 text: This is a test paragraph.
 """
-    tokens = tokenize(source)
-    ast = parse(tokens)
+    ast = parse_cached(source)
     assert isinstance(ast, DocumentNode)
     assert len(ast.children) == HEADER_AND_TEXT_COUNT
     header = ast.children[0]
@@ -30,15 +27,14 @@ text: This is a test paragraph.
     assert text.text == "This is a test paragraph."
 
 
-def test_parse_unordered_list():
+def test_parse_unordered_list(parse_cached):
     source = """
 list:
 - First item
 - Second item
 - Third item
 """
-    tokens = tokenize(source)
-    ast = parse(tokens)
+    ast = parse_cached(source)
     # Should produce a DocumentNode with one ListNode child
     assert isinstance(ast, DocumentNode)
     assert len(ast.children) == 1
@@ -54,15 +50,14 @@ list:
     ]
 
 
-def test_parse_ordered_list():
+def test_parse_ordered_list(parse_cached):
     source = """
 list:
 1. First item
 a. Second item
 i. Third item
 """
-    tokens = tokenize(source)
-    ast = parse(tokens)
+    ast = parse_cached(source)
     # Should produce a DocumentNode with one ListNode child
     assert isinstance(ast, DocumentNode)
     assert len(ast.children) == 1
@@ -78,14 +73,13 @@ i. Third item
     ]
 
 
-def test_parse_code_block():
+def test_parse_code_block(parse_cached):
     source = """
 code:
     def hello():
         return 'world'
 """
-    tokens = tokenize(source)
-    ast = parse(tokens)
+    ast = parse_cached(source)
     # Should produce a DocumentNode with one BlockNode child (block_type='code')
     assert isinstance(ast, DocumentNode)
     assert len(ast.children) == 1
@@ -99,14 +93,13 @@ code:
     assert "return 'world'" in code_text.text
 
 
-def test_parse_table_block():
+def test_parse_table_block(parse_cached):
     source = """
 table:
 - row: Header1, Header2
 - row: Value1, Value2
 """
-    tokens = tokenize(source)
-    ast = parse(tokens)
+    ast = parse_cached(source)
     # Should produce a DocumentNode with one BlockNode child (block_type='table')
     assert isinstance(ast, DocumentNode)
     assert len(ast.children) == 1
@@ -121,13 +114,12 @@ table:
     assert table_node.children[1].text == "Value1, Value2"
 
 
-def test_parse_callout_block():
+def test_parse_callout_block(parse_cached):
     source = """
 note: This is an important note.
 warn: This is a warning.
 """
-    tokens = tokenize(source)
-    ast = parse(tokens)
+    ast = parse_cached(source)
     # Should produce a DocumentNode with two BlockNode children (block_type='callout')
     assert isinstance(ast, DocumentNode)
     assert len(ast.children) == CALLOUT_COUNT
@@ -147,14 +139,13 @@ warn: This is a warning.
     assert "warning" in warn_node.children[0].text
 
 
-def test_parse_blockquote_block():
+def test_parse_blockquote_block(parse_cached):
     source = """
 blockquote:
 > This is a quoted line.
 > Another quoted line.
 """
-    tokens = tokenize(source)
-    ast = parse(tokens)
+    ast = parse_cached(source)
     # Should produce a DocumentNode with one BlockNode child (block_type='blockquote')
     assert isinstance(ast, DocumentNode)
     assert len(ast.children) == 1
@@ -169,14 +160,13 @@ blockquote:
     assert blockquote_node.children[1].text == "Another quoted line."
 
 
-def test_parse_figure_block():
+def test_parse_figure_block(parse_cached):
     source = """
 figure:
   src: /images/example.png
   caption: Example Figure
 """
-    tokens = tokenize(source)
-    ast = parse(tokens)
+    ast = parse_cached(source)
     # Should produce a DocumentNode with one BlockNode child (block_type='figure')
     assert isinstance(ast, DocumentNode)
     assert len(ast.children) == 1
@@ -192,13 +182,12 @@ figure:
     assert figure_node.children[1].text == "Example Figure"
 
 
-def test_parse_custom_directive_block():
+def test_parse_custom_directive_block(parse_cached):
     source = """
 x-foo:
 Custom directive content.
 """
-    tokens = tokenize(source)
-    ast = parse(tokens)
+    ast = parse_cached(source)
     # Should produce a DocumentNode with one BlockNode child (block_type='x-foo')
     assert isinstance(ast, DocumentNode)
     assert len(ast.children) == 1
@@ -212,7 +201,7 @@ Custom directive content.
     assert "Custom directive content." in custom_node.children[0].text
 
 
-def test_parse_definition_list_block():
+def test_parse_definition_list_block(parse_cached):
     source = """
 def-list:
 dt: Term 1
@@ -220,8 +209,7 @@ dd: Description 1
 dt: Term 2
 dd: Description 2
 """
-    tokens = tokenize(source)
-    ast = parse(tokens)
+    ast = parse_cached(source)
     # Should produce a DocumentNode with one BlockNode child (block_type='def-list')
     assert isinstance(ast, DocumentNode)
     assert len(ast.children) == 1
@@ -241,7 +229,7 @@ dd: Description 2
     assert deflist_node.children[3].text == "Description 2"
 
 
-def test_parse_multiline_text_block():
+def test_parse_multiline_text_block(parse_cached):
     source = """
 text:
 >>>
@@ -249,8 +237,7 @@ This is a paragraph.
 It spans multiple lines.
 <<<
 """
-    tokens = tokenize(source)
-    ast = parse(tokens)
+    ast = parse_cached(source)
     # Should produce a DocumentNode with one TextNode child containing
     # the full multi-line text
     assert isinstance(ast, DocumentNode)
@@ -262,3 +249,52 @@ It spans multiple lines.
     assert "This is a paragraph." in text_node.text
     assert "It spans multiple lines." in text_node.text
     assert "\n" in text_node.text  # Should preserve newlines
+
+
+def test_document_normalize_keeps_first_meta_block_first():
+    header = HeaderNode(text="Title")
+    meta = BlockNode(block_type="meta", meta={"version": "1.0.0"})
+    text = TextNode(text="Body")
+    duplicate_meta = BlockNode(block_type="meta", meta={"version": "2.0.0"})
+    document = DocumentNode(children=[header, meta, text, duplicate_meta])
+
+    children = document.normalize().children
+    assert [type(child) for child in children] == [BlockNode, HeaderNode, TextNode]
+    assert children[0] is meta
+    assert children[1] is header
+    assert children[2] is text
+
+
+def test_nodes_accept_dispatches_to_visitor_methods():
+    class RecordingVisitor:
+        def visit_document(self, node):
+            return "document"
+
+        def visit_header(self, node):
+            return "header"
+
+        def visit_text(self, node):
+            return "text"
+
+        def visit_list(self, node):
+            return "list"
+
+        def visit_block(self, node):
+            return "block"
+
+    visitor = RecordingVisitor()
+    assert DocumentNode().accept(visitor) == "document"
+    assert HeaderNode(text="Title").accept(visitor) == "header"
+    assert TextNode(text="Body").accept(visitor) == "text"
+    assert ListNode().accept(visitor) == "list"
+    assert BlockNode(block_type="code").accept(visitor) == "block"
+
+
+def test_parse_sample_document(parsed_document):
+    assert isinstance(parsed_document, DocumentNode)
+    headers = [c for c in parsed_document.children if isinstance(c, HeaderNode)]
+    assert [h.text for h in headers] == ["Sample Document"]
+    block_types = {
+        c.block_type for c in parsed_document.children if isinstance(c, BlockNode)
+    }
+    assert {"callout", "x-custom", "x-another"} <= block_types
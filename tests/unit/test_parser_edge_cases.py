@@ -8,9 +8,11 @@ This module tests the parser's handling of:
 5. Mixed content types
 """
 
+from collections import Counter
+
+import pytest
+
 from nomenic.ast import BlockNode, DocumentNode, HeaderNode, ListNode, TextNode
-from nomenic.lexer import tokenize
-from nomenic.parser import parse
 
 # Constants for test assertions
 DEEPLY_NESTED_DEPTH = 3  # Reduced from 5 to 3
@@ -20,11 +22,11 @@ MAX_TOKENS_TEST = 50  # Reduced from 1000 to 50
 MIN_TOKENS_TEST = 1
 COMPLEX_DOC_BLOCK_COUNT = 8  # Reduced from 10 to 8
 
+# Kind reported for each non-block node class, looked up by exact type
+_NODE_KIND = {HeaderNode: "header", TextNode: "text", ListNode: "list"}
 
-def test_deeply_nested_lists():
-    """Test parsing deeply nested list structures."""
-    # Create a document with nested list - simplify to just check parser doesn't break
-    source = """
+
+NESTED_LISTS_SOURCE = """
 meta: version=1.0.0
 header: Nested Lists
 list:
@@ -33,8 +35,12 @@ list:
   list:
   - Level 2 Item 1
 """
-    tokens = tokenize(source)
-    document = parse(tokens)
+
+
+def test_deeply_nested_lists(parse_cached):
+    """Test parsing deeply nested list structures."""
+    # Nested list document - simplified to just check the parser doesn't break
+    document = parse_cached(NESTED_LISTS_SOURCE)
 
     # Verify the document parsed successfully
     assert isinstance(document, DocumentNode)
@@ -45,9 +51,7 @@ list:
     assert len(list_nodes) > 0, "Expected at least one list node"
 
 
-def test_mixed_block_types():
-    """Test parsing a document with various block types mixed together."""
-    source = """
+MIXED_BLOCKS_SOURCE = """
 meta: version=1.0.0
 header: Mixed Block Types
 text: This document contains various block types.
@@ -60,65 +64,98 @@ code:
       return "Hello, world!"
 note: This is an important note.
 """
-    tokens = tokenize(source)
-    document = parse(tokens)
+
+COMPLEX_BLOCKS_SOURCE = """
+meta: version=1.0.0, author=Test
+header: Complex Document With Multiple Block Types
+text: This is a paragraph.
+list:
+- Item with some text
+- Another item
+code:
+  def example():
+      return "Hello, world!"
+note: This is an important note.
+"""
+
+
+def _node_kinds(document):
+    """Return the kind of each of a document's children in a single pass.
+
+    Blocks report their block type and header, text and list nodes their own
+    kind; any other node is skipped.
+    """
+    kinds = []
+    for child in document.children:
+        kind = _NODE_KIND.get(type(child))
+        if kind is not None:
+            kinds.append(kind)
+        elif isinstance(child, BlockNode):
+            kinds.append(child.block_type)
+    return kinds
+
+
+def _collect_block_types(document):
+    """Return the set of block types among a document's children."""
+    return set(_node_kinds(document))
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        pytest.param(MIXED_BLOCKS_SOURCE, id="mixed"),
+        pytest.param(COMPLEX_BLOCKS_SOURCE, id="complex"),
+    ],
+)
+def test_mixed_block_types(parse_cached, source):
+    """Test parsing a document with various block types mixed together."""
+    document = parse_cached(source)
 
     # Verify document structure
     assert isinstance(document, DocumentNode)
     # at least meta, header, text, list, code/note
     assert len(document.children) >= 5
 
-    # Check for presence of key block types
-    block_types = set()
-    for child in document.children:
-        if isinstance(child, BlockNode):
-            block_types.add(child.block_type)
-        elif isinstance(child, (HeaderNode, TextNode, ListNode)):
-            node_type = type(child).__name__.replace("Node", "").lower()
-            block_types.add(node_type)
+    block_types = _collect_block_types(document)
 
     # Check that we have at least these types
-    assert "meta" in block_types
-    assert "header" in block_types
-    assert "text" in block_types
-    assert "list" in block_types
+    assert {"meta", "header", "text", "list"} <= block_types
     # At least one of code or callout should be present
     assert "code" in block_types or "callout" in block_types
 
 
-def test_extremely_large_document():
+def test_extremely_large_document(parse_cached):
     """Test parsing a document with a moderate number of tokens."""
     # Create a document with multiple repetitions
-    lines = ["meta: version=1.0.0", "header: Large Document"]
-    for i in range(MAX_TOKENS_TEST):
-        lines.append(f"text: Line {i} of the document.")
+    lines = [
+        "meta: version=1.0.0",
+        "header: Large Document",
+        *[f"text: Line {i} of the document." for i in range(MAX_TOKENS_TEST)],
+    ]
 
     source = "\n".join(lines)
-    tokens = tokenize(source)
 
     # This should not cause any stack overflow or memory issues
-    document = parse(tokens)
+    document = parse_cached(source)
 
     assert isinstance(document, DocumentNode)
     # at least meta + header + several text lines
     assert len(document.children) > 20
 
 
-def test_empty_document():
+def test_empty_document(parse_cached):
     """Test parsing an empty document (should create valid but empty AST)."""
     source = ""
-    tokens = tokenize(source)
-    document = parse(tokens)
+    document = parse_cached(source)
 
     assert isinstance(document, DocumentNode)
     assert len(document.children) == 0
 
 
-def test_minimal_valid_document():
+def test_minimal_valid_document(parse_cached):
     """Test parsing a minimal valid document."""
     source = "meta: version=1.0.0"
-    tokens = tokenize(source)
-    document = parse(tokens)
+    document = parse_cached(source)
 
     assert isinstance(document, DocumentNode)
     assert len(document.children) == 1
@@ -126,9 +163,7 @@ def test_minimal_valid_document():
     assert document.children[0].block_type == "meta"
 
 
-def test_complex_header_hierarchy():
-    """Test parsing a document with complex header hierarchy."""
-    source = """
+HEADER_HIERARCHY_SOURCE = """
 meta: version=1.0.0
 header: Top Level
 text: This is top level content.
@@ -137,29 +172,22 @@ text: This is second level content.
 header: Another Top Level
 text: Another top level content.
 """
-    tokens = tokenize(source)
-    document = parse(tokens)
+
+
+def test_complex_header_hierarchy(parse_cached):
+    """Test parsing a document with complex header hierarchy."""
+    document = parse_cached(HEADER_HIERARCHY_SOURCE)
 
     # Verify document structure
     assert isinstance(document, DocumentNode)
 
     # Verify we have headers and texts
-    header_count = 0
-    text_count = 0
+    counts = Counter(map(type, document.children))
+    assert counts[HeaderNode] >= 3
+    assert counts[TextNode] >= 3
 
-    for child in document.children:
-        if isinstance(child, HeaderNode):
-            header_count += 1
-        elif isinstance(child, TextNode):
-            text_count += 1
-
-    assert header_count >= 3
-    assert text_count >= 3
 
-
-def test_interleaved_content_types():
-    """Test parsing a document with interleaved content types."""
-    source = """
+INTERLEAVED_SOURCE = """
 meta: version=1.0.0
 header: Interleaved Content
 text: First paragraph.
@@ -172,8 +200,11 @@ text: Third paragraph.
 list:
 - Item 3
 """
-    tokens = tokenize(source)
-    document = parse(tokens)
+
+
+def test_interleaved_content_types(parse_cached):
+    """Test parsing a document with interleaved content types."""
+    document = parse_cached(INTERLEAVED_SOURCE)
 
     # Verify document structure (meta, header, text, list, text, list, text, list)
     assert isinstance(document, DocumentNode)
@@ -181,59 +212,10 @@ list:
     assert len(document.children) >= 7
 
     # Verify we have a pattern of text and list nodes
-    node_types = []
-    for child in document.children:
-        if isinstance(child, TextNode):
-            node_types.append("text")
-        elif isinstance(child, ListNode):
-            node_types.append("list")
-        elif isinstance(child, HeaderNode):
-            node_types.append("header")
-        elif isinstance(child, BlockNode) and child.block_type == "meta":
-            node_types.append("meta")
+    node_types = _node_kinds(document)
 
     # Check for meta, header and alternating text/list pattern
     assert "meta" in node_types
     assert "header" in node_types
     assert node_types.count("text") >= 3
     assert node_types.count("list") >= 3
-
-
-def test_all_block_types_complex():
-    """Test parsing a document using multiple block types."""
-    source = """
-meta: version=1.0.0, author=Test
-header: Complex Document With Multiple Block Types
-text: This is a paragraph.
-list:
-- Item with some text
-- Another item
-code:
-  def example():
-      return "Hello, world!"
-note: This is an important note.
-"""
-    tokens = tokenize(source)
-    document = parse(tokens)
-
-    # Verify document structure
-    assert isinstance(document, DocumentNode)
-    # at least meta, header, text, list, code/note
-    assert len(document.children) >= 5
-
-    # Count the number of different block types
-    block_types = set()
-    for child in document.children:
-        if isinstance(child, BlockNode):
-            block_types.add(child.block_type)
-        elif isinstance(child, (HeaderNode, TextNode, ListNode)):
-            node_type = type(child).__name__.replace("Node", "").lower()
-            block_types.add(node_type)
-
-    # Check that we have at least these types
-    assert "meta" in block_types
-    assert "header" in block_types
-    assert "text" in block_types
-    assert "list" in block_types
-    # At least one of the following should be present
-    assert any(t in block_types for t in ["code", "callout"])
@@ -1,12 +1,31 @@
 """Tests for the Nomenic Core parser error handling."""
 
 import pytest
+from nomenic.ast import TextNode
 from nomenic.errors import ParserError
 from nomenic.lexer import tokenize
-from nomenic.parser import Parser, parse
+from nomenic.parser import Parser
 
+# Constants for test assertions
+RESET_DOCUMENT_NODE_COUNT = 2  # meta, header
 
-def test_parser_error_recording():
+
+@pytest.fixture
+def parser_factory():
+    """Return a callable that resets this test's Parser onto the given tokens.
+
+    Function-scoped, so settings such as strict mode never leak between tests.
+    """
+    parser = Parser([])
+
+    def _make(tokens):
+        parser.reset(tokens)
+        return parser
+
+    return _make
+
+
+def test_parser_error_recording(parser_factory):
     """Test that the parser records errors when it encounters problems."""
     # Source with various errors
     source = """
@@ -20,21 +39,14 @@ code:
     """
 
     tokens = tokenize(source)
-    parser = Parser(tokens)
+    parser = parser_factory(tokens)
     # Parse should still complete, recording errors but not raising them
     parser.parse()  # Execute parse to collect errors, but we don't need the document
 
-    # Debug prints
-    print(f"\nTotal errors recorded: {len(parser.errors)}")
-    for i, (msg, token) in enumerate(parser.errors):
-        print(f"Error {i+1}: {msg} at line {token.line}, column {token.column}")
-
     # Verify errors were recorded
     assert len(parser.errors) > 0, "No errors were recorded!"
     # At least these errors should be recorded
     error_messages = [msg for msg, _ in parser.errors]
-    for msg in error_messages:
-        print(f"Message: {msg}")
 
     expected_errors = ["header", "list item", "multi-line text block", "code block"]
     for expected in expected_errors:
@@ -45,7 +57,7 @@ code:
         )
 
 
-def test_parser_error_reporting():
+def test_parser_error_reporting(parser_factory):
     """Test that the parser can be made to raise errors immediately."""
     # Source with a specific error
     source = """
@@ -53,14 +65,14 @@ header: # Missing header text
 """
 
     tokens = tokenize(source)
-    parser = Parser(tokens)
+    parser = parser_factory(tokens)
 
     # Directly call _report_error which should raise a ParserError
     with pytest.raises(ParserError, match="header"):
         parser._report_error("Expected text after header:", parser._peek())
 
 
-def test_parser_recovers_from_errors():
+def test_parser_recovers_from_errors(parse_cached):
     """Test that the parser can recover from errors using synchronization."""
     # Source with an error in the first block but valid content after
     source = """
@@ -68,21 +80,18 @@ header: # Missing header text
 text: This is valid text content that should be parsed correctly.
 """
 
-    tokens = tokenize(source)
-    document = parse(tokens)
+    document = parse_cached(source)
 
     # Despite the error in the header, the parser should recover and parse the text
     assert len(document.children) > 0
 
     # Check that we got the text node
-    text_nodes = [
-        node for node in document.children if node.__class__.__name__ == "TextNode"
-    ]
+    text_nodes = [node for node in document.children if type(node) is TextNode]
     assert len(text_nodes) > 0
     assert any("valid text content" in node.text for node in text_nodes)
 
 
-def test_multiline_text_block_error_handling():
+def test_multiline_text_block_error_handling(parser_factory):
     """Test error handling for unterminated multi-line text blocks."""
     # Source with unterminated multi-line text block
     source = """
@@ -93,7 +102,7 @@ But the closing <<< is missing.
 """
 
     tokens = tokenize(source)
-    parser = Parser(tokens)
+    parser = parser_factory(tokens)
     document = parser.parse()
 
     # The text content should still be parsed despite the missing <<<
@@ -104,8 +113,20 @@ But the closing <<< is missing.
     assert any("unterminated" in msg.lower() for msg, _ in parser.errors)
 
     # And we should have the content in a TextNode
-    text_nodes = [
-        node for node in document.children if node.__class__.__name__ == "TextNode"
-    ]
+    text_nodes = [node for node in document.children if type(node) is TextNode]
     assert len(text_nodes) > 0
     assert any("should be parsed" in node.text for node in text_nodes)
+
+
+def test_parser_reset_clears_previous_document(parser_factory):
+    """Test that resetting a parser drops the errors of its previous document."""
+    parser = parser_factory(tokenize("header:\n"))
+    parser.parse()
+    assert parser.errors
+
+    parser = parser_factory(tokenize("meta: version=1.0.0\nheader: Title\n"))
+    document = parser.parse()
+
+    assert parser.errors == []
+    assert parser.has_meta_block
+    assert len(document.children) == RESET_DOCUMENT_NODE_COUNT
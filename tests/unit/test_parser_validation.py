@@ -1,6 +1,6 @@
-from nomenic.ast import BlockNode, HeaderNode, TextNode
+from nomenic.ast import BlockNode, HeaderNode, ListNode, TextNode
 from nomenic.lexer import tokenize
-from nomenic.parser import Parser, parse
+from nomenic.parser import Parser
 
 # Constants for test assertions
 META_BLOCK_INDEX = 0
@@ -91,15 +91,14 @@ text: Non-empty content
     assert "Non-empty content" in text_nodes[0].text
 
 
-def test_optimization_merges_adjacent_text():
+def test_optimization_merges_adjacent_text(parse_cached):
     """Test that optimization merges adjacent text nodes."""
     source = """
 meta: version=1.0.0
 text: First paragraph.
 text: Second paragraph.
 """
-    tokens = tokenize(source)
-    document = parse(tokens)  # This already applies normalize() and optimize()
+    document = parse_cached(source)  # This already applies normalize() and optimize()
 
     # After optimization
     # meta and merged text
@@ -112,7 +111,7 @@ text: Second paragraph.
     assert "Second paragraph." in text_nodes[0].text
 
 
-def test_optimization_preserves_structure():
+def test_optimization_preserves_structure(parse_cached):
     """Test that optimization preserves overall document structure."""
     source = """
 meta: version=1.0.0
@@ -122,8 +121,7 @@ list:
 - Item 1
 - Item 2
 """
-    tokens = tokenize(source)
-    document = parse(tokens)  # This already applies normalize() and optimize()
+    document = parse_cached(source)  # This already applies normalize() and optimize()
 
     # Check structure is preserved
     # meta, header, text, list
@@ -136,8 +134,6 @@ list:
     assert isinstance(document.children[TEXT_INDEX], TextNode)
 
     # List node should be preserved as ListNode (not BlockNode)
-    from nomenic.ast import ListNode
-
     list_node = document.children[LIST_INDEX]
     assert isinstance(list_node, ListNode)
     assert len(list_node.items) == EXPECTED_LIST_ITEMS
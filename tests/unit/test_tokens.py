@@ -6,6 +6,12 @@ from src.nomenic.tokens import Token, TokenType
 TEST_LINE_NUMBER = 5
 TEST_COLUMN_NUMBER = 10
 
+# Expected str() of Token(TokenType.HEADER, "Test Header", 1, 0)
+EXPECTED_TOKEN_STR = (
+    "Token(type=TokenType.HEADER, value='Test Header', line=1, column=0, "
+    "indent_level=0, metadata=None)"
+)
+
 
 def test_token_creation():
     """Test that tokens can be created with correct values."""
@@ -19,11 +25,13 @@ def test_token_creation():
 def test_token_str_representation():
     """Test the string representation of tokens."""
     token = Token(TokenType.HEADER, "Test Header", 1, 0)
-    expected_str = (
-        "Token(type=TokenType.HEADER, value='Test Header', line=1, column=0, "
-        "indent_level=0, metadata=None)"
-    )
-    assert str(token) == expected_str
+    assert str(token) == EXPECTED_TOKEN_STR
+
+
+def test_token_type_str_and_format():
+    """Test that token types render by name under both str() and format()."""
+    assert str(TokenType.META) == "TokenType.META"
+    assert f"{TokenType.META}" == "TokenType.META"
 
 
 def test_token_equality():